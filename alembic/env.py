@@ -25,6 +25,7 @@ def _load_metadata():
     import zsim.api_src.services.database.apl_db  # noqa: F401
     import zsim.api_src.services.database.character_db  # noqa: F401
     import zsim.api_src.services.database.enemy_db  # noqa: F401
+    import zsim.api_src.services.database.result_catalog_db  # noqa: F401
     import zsim.api_src.services.database.session_db  # noqa: F401
     from zsim.api_src.services.database.orm import Base
 
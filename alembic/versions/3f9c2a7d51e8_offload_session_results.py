@@ -0,0 +1,66 @@
+"""offload session results
+
+Revision ID: 3f9c2a7d51e8
+Revises: 74ee1818bd42
+Create Date: 2026-10-19 10:12:37.000000
+
+"""
+
+from __future__ import annotations
+
+import zlib
+from typing import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "3f9c2a7d51e8"
+down_revision: str | Sequence[str] | None = "74ee1818bd42"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """执行升级操作：将会话结果迁移至独立的压缩存储表"""
+    op.create_table(
+        "session_results",
+        sa.Column("session_id", sa.String(length=128), nullable=False),
+        sa.Column("payload", sa.LargeBinary(), nullable=False),
+        sa.Column("raw_size", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["session_id"], ["sessions.session_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("session_id"),
+    )
+
+    conn = op.get_bind()
+    rows = conn.execute(
+        sa.text("SELECT session_id, session_result FROM sessions WHERE session_result IS NOT NULL")
+    ).fetchall()
+    for session_id, session_result in rows:
+        raw = session_result.encode("utf-8")
+        conn.execute(
+            sa.text(
+                "INSERT INTO session_results (session_id, payload, raw_size) "
+                "VALUES (:session_id, :payload, :raw_size)"
+            ),
+            {"session_id": session_id, "payload": zlib.compress(raw, 6), "raw_size": len(raw)},
+        )
+
+    with op.batch_alter_table("sessions") as batch_op:
+        batch_op.drop_column("session_result")
+
+
+def downgrade() -> None:
+    """执行回滚操作：将会话结果写回sessions表"""
+    with op.batch_alter_table("sessions") as batch_op:
+        batch_op.add_column(sa.Column("session_result", sa.Text(), nullable=True))
+
+    conn = op.get_bind()
+    rows = conn.execute(sa.text("SELECT session_id, payload FROM session_results")).fetchall()
+    for session_id, payload in rows:
+        conn.execute(
+            sa.text("UPDATE sessions SET session_result = :result WHERE session_id = :session_id"),
+            {"session_id": session_id, "result": zlib.decompress(payload).decode("utf-8")},
+        )
+
+    op.drop_table("session_results")
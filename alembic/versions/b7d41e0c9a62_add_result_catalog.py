@@ -0,0 +1,52 @@
+"""add result catalog
+
+Revision ID: b7d41e0c9a62
+Revises: 3f9c2a7d51e8
+Create Date: 2026-10-19 14:05:21.000000
+
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "b7d41e0c9a62"
+down_revision: str | Sequence[str] | None = "3f9c2a7d51e8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """执行升级操作：新增模拟结果目录索引表"""
+    op.create_table(
+        "result_catalog",
+        sa.Column("run_id", sa.String(length=255), nullable=False),
+        sa.Column("parent_id", sa.String(length=128), nullable=True),
+        sa.Column("mode", sa.String(length=32), nullable=False),
+        sa.Column("created_at", sa.String(length=32), nullable=False),
+        sa.Column("finished_at", sa.String(length=32), nullable=True),
+        sa.Column("config_fingerprint", sa.String(length=64), nullable=True),
+        sa.Column("name_box", sa.Text(), nullable=True),
+        sa.Column("total_damage", sa.Float(), nullable=True),
+        sa.Column("dps", sa.Float(), nullable=True),
+        sa.Column("end_tick", sa.Integer(), nullable=True),
+        sa.Column("comment", sa.Text(), nullable=False),
+        sa.Column("path", sa.Text(), nullable=False),
+        sa.Column("artifacts", sa.Text(), nullable=False),
+        sa.PrimaryKeyConstraint("run_id"),
+    )
+    op.create_index("ix_result_catalog_created_at", "result_catalog", ["created_at"])
+    op.create_index("ix_result_catalog_parent_id", "result_catalog", ["parent_id"])
+    op.create_index("ix_result_catalog_fingerprint", "result_catalog", ["config_fingerprint"])
+
+
+def downgrade() -> None:
+    """执行回滚操作：删除模拟结果目录索引表"""
+    op.drop_index("ix_result_catalog_fingerprint", table_name="result_catalog")
+    op.drop_index("ix_result_catalog_parent_id", table_name="result_catalog")
+    op.drop_index("ix_result_catalog_created_at", table_name="result_catalog")
+    op.drop_table("result_catalog")